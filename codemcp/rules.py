@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 
+import functools
 import logging
 import os
-import re
-from dataclasses import dataclass
+from dataclasses import KW_ONLY, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, TextIO, Tuple
 
-from codemcp.glob_pattern import match as glob_match
+from codemcp.glob_pattern import make_matcher
 
 __all__ = [
     "Rule",
@@ -20,18 +20,73 @@ __all__ = [
 
 @dataclass
 class Rule:
-    """Represents a cursor rule loaded from an MDC file."""
+    """Represents a cursor rule loaded from an MDC file.
+
+    Only the frontmatter is parsed when the rule is loaded; the payload is read
+    from the file the first time it is accessed, since most rules only end up
+    as suggestions and their payload is never needed.
+    """
 
     description: Optional[str]  # Description of when the rule is useful
     globs: List[str]  # List of glob patterns to match files
     always_apply: bool  # Whether the rule should always be applied
-    payload: str  # The markdown content of the rule
+    # The remaining fields are keyword-only: file_path used to come after the
+    # payload, so an old positional call must fail rather than mix them up
+    _: KW_ONLY
     file_path: str  # Path to the MDC file
+    # Matchers compiled from globs, see _compile_glob
+    compiled_globs: List[Callable[[str, str], bool]] = field(
+        default_factory=list[Callable[[str, str], bool]], compare=False, repr=False
+    )
+    # st_mtime_ns and st_size of the file the frontmatter was parsed from
+    mtime_ns: Optional[int] = field(default=None, compare=False, repr=False)
+    size: Optional[int] = field(default=None, compare=False, repr=False)
+    # Cached payload, see the payload property
+    _payload: Optional[str] = field(default=None, compare=False, repr=False)
+
+    @property
+    def payload(self) -> str:
+        """The markdown content of the rule, or "" if it could not be read."""
+        payload = self.read_payload()
+        return payload if payload is not None else ""
+
+    def read_payload(self) -> Optional[str]:
+        """Read the markdown content of the rule from its file.
+
+        If the file has changed since the frontmatter was parsed, its body no
+        longer belongs to this rule, so it is not used; load_rule_from_file
+        returns an up to date rule for the edited file.
+
+        Returns:
+            The payload, or None if the file could not be read or has changed
+        """
+        if self._payload is None:
+            try:
+                with open(self.file_path, "r", encoding="utf-8") as f:
+                    st = os.fstat(f.fileno())
+                    if (
+                        self.mtime_ns is not None and st.st_mtime_ns != self.mtime_ns
+                    ) or (self.size is not None and st.st_size != self.size):
+                        logging.warning(
+                            f"Rule file {self.file_path} changed since it was loaded, ignoring its payload"
+                        )
+                        return None
+                    parts = _read_frontmatter(f)
+                    self._payload = (
+                        (parts[1] + f.read()).strip() if parts is not None else ""
+                    )
+            except Exception as e:
+                logging.error(f"Error loading rule payload from {self.file_path}: {e}")
+                return None
+        return self._payload
 
 
 def load_rule_from_file(file_path: str) -> Optional[Rule]:
     """Load a rule from an MDC file.
 
+    Parsed rules are cached, keyed on the file's modification time and size,
+    so repeated lookups only re-read the file after it has been edited.
+
     Args:
         file_path: Path to the MDC file
 
@@ -39,52 +94,180 @@ def load_rule_from_file(file_path: str) -> Optional[Rule]:
         A Rule object if the file is valid, None otherwise
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Parse the frontmatter and content
-        frontmatter_match = re.match(r"^---\n(.*?)\n---\n(.*)", content, re.DOTALL)
-        if not frontmatter_match:
-            return None
-
-        frontmatter_text = frontmatter_match.group(1)
-        payload = frontmatter_match.group(2).strip()
-
-        # We need to manually parse the frontmatter to handle unquoted glob patterns
-        frontmatter: Dict[str, str] = {}
-        for line in frontmatter_text.strip().split("\n"):
-            if ":" in line:
-                key, value = line.split(":", 1)
-                key = key.strip()
-                value = value.strip()
-                frontmatter[key] = value
-
-        # Extract rule properties
-        description: Optional[str] = frontmatter.get("description")
-
-        # Handle globs - can be comma-separated string or a list
-        globs: List[str] = []
-        globs_value: Optional[str] = frontmatter.get("globs")
-        if globs_value:
-            globs = [g.strip() for g in globs_value.split(",")]
-
-        # Convert alwaysApply string to boolean
-        always_apply_value: str = frontmatter.get("alwaysApply", "false")
-        always_apply: bool = always_apply_value.lower() == "true"
-
-        return Rule(
-            description=description,
-            globs=globs,
-            always_apply=always_apply,
-            payload=payload,
-            file_path=file_path,
-        )
+        st = os.stat(file_path)
+        return _load_rule_cached(file_path, st.st_mtime_ns, st.st_size)
     except Exception as e:
         # If there's any error parsing the file, return None
         logging.error(f"Error loading rule from {file_path}: {e}")
         return None
 
 
+# Frontmatter is normally tiny, so rule files are read in chunks of this many
+# characters until the end of the frontmatter is found
+_FRONTMATTER_CHUNK_SIZE = 8192
+
+
+def _read_frontmatter(f: TextIO) -> Optional[Tuple[str, str]]:
+    """Read the frontmatter of an MDC file without reading the whole file.
+
+    The file must start with a "---" line, and the frontmatter runs up to the
+    next "---" line.
+
+    Args:
+        f: The MDC file, opened in text mode at its start
+
+    Returns:
+        A (frontmatter_text, payload_start) tuple, where payload_start is the
+        part of the payload that was read along with the frontmatter, or None
+        if the file has no frontmatter
+    """
+    head = f.read(_FRONTMATTER_CHUNK_SIZE)
+    if not head.startswith("---\n"):
+        return None
+    frontmatter_end = head.find("\n---\n", 4)
+    while frontmatter_end < 0:
+        chunk = f.read(_FRONTMATTER_CHUNK_SIZE)
+        if not chunk:
+            return None
+        # The closing delimiter may straddle the chunk boundary
+        search_start = max(4, len(head) - 4)
+        head += chunk
+        frontmatter_end = head.find("\n---\n", search_start)
+    return head[4:frontmatter_end], head[frontmatter_end + 5 :]
+
+
+@functools.lru_cache(maxsize=512)
+def _load_rule_cached(file_path: str, mtime_ns: int, size: int) -> Optional[Rule]:
+    """Parse an MDC file, cached on (file_path, mtime_ns, size).
+
+    mtime_ns and size are also recorded on the Rule, so that its payload is
+    only read from the same version of the file.
+    """
+    # Only the frontmatter is read here, see Rule.payload
+    with open(file_path, "r", encoding="utf-8") as f:
+        parts = _read_frontmatter(f)
+    if parts is None:
+        return None
+    frontmatter_text = parts[0]
+
+    # We need to manually parse the frontmatter to handle unquoted glob patterns
+    frontmatter: Dict[str, str] = {}
+    for line in frontmatter_text.split("\n"):
+        if ":" in line:
+            key, value = line.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+            frontmatter[key] = value
+
+    # Extract rule properties
+    description: Optional[str] = frontmatter.get("description")
+
+    # Handle globs - can be comma-separated string or a list
+    globs: List[str] = []
+    globs_value: Optional[str] = frontmatter.get("globs")
+    if globs_value:
+        globs = [g.strip() for g in globs_value.split(",")]
+
+    # Convert alwaysApply string to boolean
+    always_apply_value: str = frontmatter.get("alwaysApply", "false")
+    always_apply: bool = always_apply_value.lower() == "true"
+
+    return Rule(
+        description=description,
+        globs=globs,
+        always_apply=always_apply,
+        file_path=file_path,
+        compiled_globs=[_compile_glob(g) for g in globs],
+        mtime_ns=mtime_ns,
+        size=size,
+    )
+
+
+# Characters that give a glob pattern special meaning; patterns (or pattern
+# fragments) without any of these can be matched with plain string operations.
+_GLOB_SPECIAL_CHARS = frozenset("*?[\\")
+
+
+def _is_literal(pattern: str) -> bool:
+    return not any(c in _GLOB_SPECIAL_CHARS for c in pattern)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_glob(glob_pattern: str) -> Callable[[str, str], bool]:
+    """Compile a glob pattern into a matcher function.
+
+    The returned function takes a normalized relative path (using / as the
+    separator) and the file name, and returns True if the pattern matches.
+    Common pattern shapes are special-cased to avoid regex matching entirely.
+
+    Args:
+        glob_pattern: Glob pattern to compile
+
+    Returns:
+        A function (path, file_name) -> bool
+    """
+    # Patterns without path separators only look at the file name
+    if "/" not in glob_pattern:
+        # name: exact file name
+        if _is_literal(glob_pattern):
+            return lambda path, file_name: file_name == glob_pattern
+
+        # *.ext: file name suffix
+        if glob_pattern.startswith("*.") and _is_literal(glob_pattern[1:]):
+            name_suffix = glob_pattern[1:]
+            return lambda path, file_name: file_name.endswith(name_suffix)
+
+        # *name*: file name substring
+        inner = glob_pattern[1:-1]
+        if (
+            len(glob_pattern) > 2
+            and glob_pattern[0] == "*"
+            and glob_pattern[-1] == "*"
+            and _is_literal(inner)
+        ):
+            return lambda path, file_name: inner in file_name
+
+    # dir/name: exact relative path
+    elif _is_literal(glob_pattern):
+        return lambda path, file_name: path == glob_pattern
+
+    # dir/*.ext: a file extension directly inside a directory
+    dir_name, _, base_pattern = glob_pattern.rpartition("/")
+    if (
+        dir_name
+        and _is_literal(dir_name)
+        and base_pattern.startswith("*.")
+        and _is_literal(base_pattern[1:])
+    ):
+        ext = base_pattern[1:]
+        return lambda path, file_name: (
+            file_name.endswith(ext) and path.rpartition("/")[0] == dir_name
+        )
+
+    # **/*.ext or dir/**/*.ext: a directory prefix plus a file extension
+    head, sep, tail = glob_pattern.rpartition("**/")
+    if (
+        sep
+        and (head == "" or head.endswith("/"))
+        and _is_literal(head)
+        and tail.startswith("*.")
+        and _is_literal(tail[1:])
+    ):
+        path_suffix = tail[1:]
+        return lambda path, file_name: (
+            path.startswith(head) and path.endswith(path_suffix)
+        )
+
+    # Use the glob matcher from glob_pattern.py for everything else
+    # Cursor rules use vanilla glob patterns (not editorconfig features)
+    matcher = make_matcher(glob_pattern)
+
+    # For filename-only patterns (without path separators), we can match just the filename
+    if "/" not in glob_pattern:
+        return lambda path, file_name: matcher(file_name)
+    return lambda path, file_name: matcher(path)
+
+
 def match_file_with_glob(file_path: str, glob_pattern: str) -> bool:
     """Check if a file path matches a glob pattern.
 
@@ -95,10 +278,6 @@ def match_file_with_glob(file_path: str, glob_pattern: str) -> bool:
     Returns:
         True if the file matches the pattern, False otherwise
     """
-    logging.debug(
-        f"match_file_with_glob: checking if '{file_path}' matches pattern '{glob_pattern}'"
-    )
-
     # Normalize path for matching
     # Paths are normalized to use / for consistent matching across platforms
     path = Path(file_path)
@@ -110,24 +289,82 @@ def match_file_with_glob(file_path: str, glob_pattern: str) -> bool:
         f"File path must be relative, got absolute path: {normalized_path}"
     )
 
-    # For filename-only patterns (without path separators), we can match just the filename
-    if "/" not in glob_pattern:
-        file_name = path.name
-        result = glob_match(glob_pattern, file_name)
-        logging.debug(
-            f"Filename match: pattern='{glob_pattern}', file='{file_name}', result={result}"
-        )
-        return result
-
-    # Use the glob matcher from glob.py for full path matching
-    # Cursor rules use vanilla glob patterns (not editorconfig features)
-    result = glob_match(glob_pattern, normalized_path)
+    result = _compile_glob(glob_pattern)(normalized_path, path.name)
     logging.debug(
-        f"Path match: pattern='{glob_pattern}', path='{normalized_path}', result={result}"
+        f"match_file_with_glob: pattern='{glob_pattern}', path='{normalized_path}', result={result}"
     )
     return result
 
 
+# Cached .cursor/rules listings: rules_dir -> ((directory, st_mtime_ns) for
+# every directory scanned, paths of the .mdc files found). Kept in insertion
+# order and capped at _RULE_FILES_CACHE_SIZE entries, oldest evicted first.
+_RULE_FILES_CACHE_SIZE = 128
+_rule_files_cache: Dict[str, Tuple[List[Tuple[str, int]], List[str]]] = {}
+
+
+def _list_rule_files(rules_dir: str) -> List[str]:
+    """Return the paths of all MDC files under a .cursor/rules directory.
+
+    The directory is scanned with os.scandir and an explicit stack rather
+    than os.walk, since the directory entries already tell us whether each
+    entry is a file or a directory without extra stat calls.
+
+    Listings are cached per rules directory. Adding, removing or renaming an
+    entry changes the mtime of the containing directory, so a cached listing
+    is reused as long as none of the directories it scanned have a new mtime.
+
+    Args:
+        rules_dir: Path to the .cursor/rules directory
+
+    Returns:
+        Paths of the .mdc files, files of a directory before its subdirectories
+    """
+    cached = _rule_files_cache.get(rules_dir)
+    if cached is not None:
+        try:
+            if all(os.stat(d).st_mtime_ns == m for d, m in cached[0]):
+                return cached[1]
+        except OSError:
+            pass
+
+    dir_mtimes: List[Tuple[str, int]] = []
+    rule_files: List[str] = []
+    complete = True
+    stack = [rules_dir]
+    while stack:
+        current = stack.pop()
+        dir_files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            # Stat before scanning, so a concurrent change invalidates the entry
+            mtime_ns = os.stat(current).st_mtime_ns
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(".mdc"):
+                        dir_files.append(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError as e:
+            # Skip unreadable or vanished directories, like os.walk does
+            logging.debug(f"Skipping rules directory {current}: {e}")
+            complete = False
+            continue
+        dir_mtimes.append((current, mtime_ns))
+        rule_files.extend(dir_files)
+        # Push in reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+    # Fixing permissions does not change a directory's mtime, so only cache
+    # listings where every directory could be read
+    if complete:
+        _rule_files_cache.pop(rules_dir, None)
+        while len(_rule_files_cache) >= _RULE_FILES_CACHE_SIZE:
+            del _rule_files_cache[next(iter(_rule_files_cache))]
+        _rule_files_cache[rules_dir] = (dir_mtimes, rule_files)
+    return rule_files
+
+
 def find_applicable_rules(
     repo_root: str, file_path: Optional[str] = None
 ) -> Tuple[List[Rule], List[Tuple[str, str]]]:
@@ -149,20 +386,52 @@ def find_applicable_rules(
     suggested_rules: List[Tuple[str, str]] = []
     processed_rule_files: Set[str] = set()
 
-    # Normalize paths
-    repo_root = os.path.abspath(repo_root)
+    # Normalize paths, resolving relative paths against a single getcwd() call
+    cwd = os.getcwd()
+    repo_root = os.path.normpath(os.path.join(cwd, repo_root))
     logging.debug(
         f"Finding applicable rules for repo_root={repo_root}, file_path={file_path}"
     )
 
     # If file_path is provided, walk up from its directory to repo_root
     # Otherwise, just check repo_root
-    start_dir = os.path.dirname(os.path.abspath(file_path)) if file_path else repo_root
-    current_dir = start_dir
-    logging.debug(f"Starting directory search at: {current_dir}")
-
-    # Ensure we don't go beyond repo_root
-    while current_dir.startswith(repo_root):
+    start_dir = (
+        os.path.dirname(os.path.normpath(os.path.join(cwd, file_path)))
+        if file_path
+        else repo_root
+    )
+    logging.debug(f"Starting directory search at: {start_dir}")
+
+    # Glob patterns are matched against the path relative to repo_root, so
+    # compute it (and the file name) once rather than per rule and pattern
+    rel_file_path = ""
+    file_name = ""
+    if file_path:
+        rel_file_path = file_path
+        if os.path.isabs(file_path):
+            rel_file_path = os.path.relpath(file_path, repo_root)
+            logging.debug(
+                f"Converting absolute path to relative: {file_path} → {rel_file_path}"
+            )
+        rel_file_path = str(Path(rel_file_path)).replace(os.sep, "/")
+        file_name = os.path.basename(rel_file_path)
+
+    # Collect the directories from start_dir up to and including repo_root.
+    # Both are normalized absolute paths, so start_dir is inside repo_root
+    # exactly when it equals it or starts with it plus a separator (a plain
+    # prefix check would also accept siblings like /repo-other for /repo).
+    ancestors: List[str] = []
+    root_prefix = repo_root if repo_root.endswith(os.sep) else repo_root + os.sep
+    if start_dir == repo_root or start_dir.startswith(root_prefix):
+        current_dir = start_dir
+        while True:
+            ancestors.append(current_dir)
+            if len(current_dir) <= len(repo_root):
+                break
+            current_dir = os.path.dirname(current_dir)
+    logging.debug(f"Searching for rules in: {ancestors}")
+
+    for current_dir in ancestors:
         # Look for .cursor/rules directory
         rules_dir = os.path.join(current_dir, ".cursor", "rules")
         logging.debug(f"Checking for rules directory: {rules_dir}")
@@ -171,79 +440,43 @@ def find_applicable_rules(
             logging.debug(f"Found rules directory: {rules_dir}")
 
             # Find all MDC files in this directory
-            for root, _, files in os.walk(rules_dir):
-                for filename in files:
-                    if filename.endswith(".mdc"):
-                        rule_file_path = os.path.join(root, filename)
-                        logging.debug(f"Considering rule file: {rule_file_path}")
-
-                        # Skip if we've already processed this file
-                        if rule_file_path in processed_rule_files:
-                            logging.debug(
-                                f"Skipping already processed rule file: {rule_file_path}"
-                            )
-                            continue
-                        processed_rule_files.add(rule_file_path)
-
-                        # Load the rule
-                        rule = load_rule_from_file(rule_file_path)
-                        if rule is None:
-                            logging.debug(
-                                f"Failed to load rule from file: {rule_file_path}"
-                            )
-                            continue
-
-                        # Check if this rule applies
-                        if rule.always_apply:
-                            logging.debug(f"Rule always applies: {rule_file_path}")
-                            applicable_rules.append(rule)
-                        elif file_path and rule.globs:
-                            # Check if any glob pattern matches the file
-                            logging.debug(
-                                f"Checking glob patterns for rule: {rule_file_path}"
-                            )
-                            for glob_pattern in rule.globs:
-                                logging.debug(
-                                    f"Testing glob pattern: {glob_pattern} against file: {file_path}"
-                                )
-                                # Convert absolute path to relative path if needed
-                                rel_file_path = file_path
-                                if os.path.isabs(file_path):
-                                    rel_file_path = os.path.relpath(
-                                        file_path, repo_root
-                                    )
-                                    logging.debug(
-                                        f"Converting absolute path to relative: {file_path} → {rel_file_path}"
-                                    )
-
-                                if match_file_with_glob(rel_file_path, glob_pattern):
-                                    logging.debug(
-                                        f"Glob pattern matched: {glob_pattern}"
-                                    )
-                                    applicable_rules.append(rule)
-                                    break
-                                else:
-                                    logging.debug(
-                                        f"Glob pattern did not match: {glob_pattern}"
-                                    )
-                        elif rule.description:
-                            # Add to suggested rules if it has a description
-                            logging.debug(
-                                f"Adding rule to suggested rules: {rule_file_path}"
-                            )
-                            suggested_rules.append((rule.description, rule_file_path))
-                        else:
-                            logging.debug(
-                                f"Rule not applicable (no globs match or missing description): {rule_file_path}"
-                            )
-
-        # Move up one directory
-        parent_dir = os.path.dirname(current_dir)
-        if parent_dir == current_dir:  # We've reached the root
-            logging.debug("Reached filesystem root, stopping directory traversal")
-            break
-        current_dir = parent_dir
-        logging.debug(f"Moving up to parent directory: {current_dir}")
+            for rule_file_path in _list_rule_files(rules_dir):
+                logging.debug(f"Considering rule file: {rule_file_path}")
+
+                # Skip if we've already processed this file
+                if rule_file_path in processed_rule_files:
+                    logging.debug(
+                        f"Skipping already processed rule file: {rule_file_path}"
+                    )
+                    continue
+                processed_rule_files.add(rule_file_path)
+
+                # Load the rule
+                rule = load_rule_from_file(rule_file_path)
+                if rule is None:
+                    logging.debug(f"Failed to load rule from file: {rule_file_path}")
+                    continue
+
+                # Check if this rule applies
+                if rule.always_apply:
+                    logging.debug(f"Rule always applies: {rule_file_path}")
+                    applicable_rules.append(rule)
+                elif file_path and rule.globs:
+                    # Check if any glob pattern matches the file
+                    logging.debug(f"Checking glob patterns for rule: {rule_file_path}")
+                    if any(m(rel_file_path, file_name) for m in rule.compiled_globs):
+                        logging.debug(f"Glob pattern matched: {rule.globs}")
+                        applicable_rules.append(rule)
+                    else:
+                        logging.debug(f"Glob patterns did not match: {rule.globs}")
+                elif rule.description:
+                    # Add to suggested rules if it has a description
+                    logging.debug(f"Adding rule to suggested rules: {rule_file_path}")
+                    suggested_rules.append((rule.description, rule_file_path))
+                else:
+                    logging.debug(
+                        f"Rule not applicable (no globs match or missing description): {rule_file_path}"
+                    )
 
     logging.debug(
         f"Found {len(applicable_rules)} applicable rules and {len(suggested_rules)} suggested rules"
@@ -270,7 +503,18 @@ def get_applicable_rules_content(
         logging.debug(
             f"get_applicable_rules_content called with repo_root={repo_root}, file_path={file_path}"
         )
-        result = ""
+        parts: List[str] = []
+
+        # Rule paths from find_applicable_rules are normalized absolute paths
+        # under repo_root, so they can usually be made relative by slicing
+        # off the root prefix instead of calling os.path.relpath
+        root_abs = os.path.abspath(repo_root)
+        root_prefix = root_abs if root_abs.endswith(os.sep) else root_abs + os.sep
+
+        def rel(path: str) -> str:
+            if path.startswith(root_prefix):
+                return path[len(root_prefix) :]
+            return os.path.relpath(path, root_abs)
 
         # Find applicable rules
         applicable_rules, suggested_rules = find_applicable_rules(repo_root, file_path)
@@ -278,30 +522,39 @@ def get_applicable_rules_content(
             f"Retrieved {len(applicable_rules)} applicable rules and {len(suggested_rules)} suggested rules"
         )
 
+        # Read the payloads of the applicable rules, skipping rules whose file
+        # could not be read or has changed since its frontmatter was parsed
+        loaded_rules: List[Tuple[Rule, str]] = []
+        for rule in applicable_rules:
+            payload = rule.read_payload()
+            if payload is not None:
+                loaded_rules.append((rule, payload))
+
         # If we have applicable rules, add them to the output
-        if applicable_rules or suggested_rules:
-            result += "\n\n// .cursor/rules results:"
+        if loaded_rules or suggested_rules:
+            parts.append("\n\n// .cursor/rules results:")
             logging.debug("Adding rule results to output")
 
             # Add directly applicable rules
-            for i, rule in enumerate(applicable_rules):
-                rel_path = os.path.relpath(rule.file_path, repo_root)
+            for i, (rule, payload) in enumerate(loaded_rules):
+                rel_path = rel(rule.file_path)
                 logging.debug(
-                    f"Adding applicable rule {i + 1}/{len(applicable_rules)}: {rel_path}"
+                    f"Adding applicable rule {i + 1}/{len(loaded_rules)}: {rel_path}"
                 )
-                rule_content = f"\n\n// Rule from {rel_path}:\n{rule.payload}"
-                result += rule_content
+                parts.append(f"\n\n// Rule from {rel_path}:\n")
+                parts.append(payload)
 
             # Add suggestions for rules with descriptions
             for i, (description, rule_path) in enumerate(suggested_rules):
-                rel_path = os.path.relpath(rule_path, repo_root)
+                rel_path = rel(rule_path)
                 logging.debug(
                     f"Adding suggested rule {i + 1}/{len(suggested_rules)}: {rel_path} ('{description}')"
                 )
-                result += f"\n\n// If {description} applies, load {rel_path}"
+                parts.append(f"\n\n// If {description} applies, load {rel_path}")
         else:
             logging.debug("No applicable or suggested rules found")
 
+        result = "".join(parts)
         logging.debug(f"Returning {len(result)} characters of rule content")
         return result
     except Exception as e:
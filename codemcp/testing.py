@@ -2,8 +2,11 @@
 
 
 import asyncio
+import atexit
+import functools
 import os
 import re
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -16,22 +19,11 @@ from typing import (
     List,
     Optional,
     Protocol,
+    Tuple,
     TypeVar,
     Union,
     cast,
 )
-
-
-# Define a local ExceptionGroup class for type checking purposes
-# In Python 3.11+, this would be available as a built-in
-class ExceptionGroup(Exception):
-    """Simple ExceptionGroup implementation for type checking."""
-
-    def __init__(self, message: str, exceptions: List[Exception]) -> None:
-        self.exceptions: List[Exception] = exceptions
-        super().__init__(message, exceptions)
-
-
 from unittest import mock
 
 from expecttest import TestCase
@@ -41,6 +33,30 @@ from mcp.client.stdio import stdio_client
 # Define types for objects used in the testing module
 T = TypeVar("T")
 
+# Matches the chat ID reported by InitProject
+_CHAT_ID_RE = re.compile(r"chat ID: ([a-zA-Z0-9-]+)")
+
+
+def _tmpfs_root() -> Optional[str]:
+    """Return /dev/shm if test repositories can be created there.
+
+    tmpfs makes the many small files git creates cheap to write and to clean
+    up. /dev/shm is skipped when it is mounted noexec, as it is by default in
+    Docker, since tests run scripts from inside their repository.
+
+    Returns:
+        Optional[str]: "/dev/shm", or None to use the default temp directory
+    """
+    if not os.path.isdir("/dev/shm") or not os.access("/dev/shm", os.W_OK):
+        return None
+    if os.statvfs("/dev/shm").f_flag & os.ST_NOEXEC:
+        return None
+    return "/dev/shm"
+
+
+# Put test repositories on tmpfs when available (Linux)
+_TEMP_ROOT: Optional[str] = _tmpfs_root()
+
 
 class TextContent(Protocol):
     """Protocol for objects with a text attribute."""
@@ -55,6 +71,80 @@ class CallToolResult(Protocol):
     content: Union[str, List[TextContent], Any]
 
 
+# Environment variables, besides GIT_*, that can affect the template
+# repository. Everything else is left out of its cache key, in particular
+# PYTEST_CURRENT_TEST, which is different for every test.
+_TEMPLATE_ENV_VARS = frozenset(
+    {"HOME", "LANG", "LC_ALL", "PATH", "TZ", "XDG_CONFIG_HOME"}
+)
+
+
+def _template_env_key(env: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+    """Select the parts of a test environment that affect the template repository.
+
+    Args:
+        env: The test environment
+
+    Returns:
+        The relevant variables as sorted (key, value) pairs
+    """
+    return tuple(
+        sorted(
+            (key, value)
+            for key, value in env.items()
+            if key.startswith("GIT_") or key in _TEMPLATE_ENV_VARS
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _template_repository(env_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Create a git repository with the initial test commit, once per process.
+
+    Tests copy this template instead of running git init/add/commit each time.
+
+    Args:
+        env_items: The environment to run git with, from _template_env_key, so
+            that differently configured environments get their own template
+
+    Returns:
+        str: Path to the template repository
+
+    Raises:
+        subprocess.CalledProcessError: If any git command fails
+    """
+    template_dir = tempfile.mkdtemp(prefix="codemcp_template_repo_", dir=_TEMP_ROOT)
+    atexit.register(shutil.rmtree, template_dir, ignore_errors=True)
+    env = dict(env_items)
+
+    def git(*args: str) -> None:
+        subprocess.run(
+            ["git", *args],
+            cwd=template_dir,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+    # Initialize and configure git; the user config is appended directly
+    # rather than spawning a git config process per key
+    git("init", "-b", "main")
+    with open(os.path.join(template_dir, ".git", "config"), "a") as f:
+        f.write("[user]\n\temail = test@example.com\n\tname = Test User\n")
+
+    # Create initial commit
+    with open(os.path.join(template_dir, "README.md"), "w") as f:
+        f.write("# Test Repository\n")
+
+    # Create a codemcp.toml file in the repo root (required for permission checks)
+    with open(os.path.join(template_dir, "codemcp.toml"), "w") as f:
+        f.write("")
+
+    git("add", "README.md", "codemcp.toml")
+    git("commit", "-m", "Initial commit")
+    return template_dir
+
+
 class MCPEndToEndTestCase(TestCase, unittest.IsolatedAsyncioTestCase):
     """Base class for end-to-end tests of codemcp using MCP client."""
 
@@ -63,7 +153,7 @@ class MCPEndToEndTestCase(TestCase, unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         """Async setup method to prepare the test environment."""
         # Create a temporary directory for testing
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TEMP_ROOT)
         self.testing_time = "1112911993"  # Fixed timestamp for git
 
         # Initialize environment variables for git
@@ -104,34 +194,29 @@ class MCPEndToEndTestCase(TestCase, unittest.IsolatedAsyncioTestCase):
         """Setup a git repository for testing with an initial commit.
 
         This method can be overridden by subclasses to customize the repository setup.
-        By default, it initializes a git repository and creates an initial commit.
+        By default, it copies a git repository with an initial commit, which is
+        created once per process.
         """
-        # Initialize and configure git
         try:
-            await self.git_run(["init", "-b", "main"])
-        except subprocess.CalledProcessError:
-            self.fail(
-                "git version is too old for tests! Please install a newer version of git."
-            )
-        await self.git_run(["config", "user.email", "test@example.com"])
-        await self.git_run(["config", "user.name", "Test User"])
-
-        # Create initial commit
-        readme_path = os.path.join(self.temp_dir.name, "README.md")
-        with open(readme_path, "w") as f:  # noqa: ASYNC230
-            f.write("# Test Repository\n")
-
-        # Create a codemcp.toml file in the repo root (required for permission checks)
-        codemcp_toml_path = os.path.join(self.temp_dir.name, "codemcp.toml")
-        with open(codemcp_toml_path, "w") as f:  # noqa: ASYNC230
-            f.write("")
-
-        await self.git_run(["add", "README.md", "codemcp.toml"])
-        await self.git_run(["commit", "-m", "Initial commit"])
+            template_dir = _template_repository(_template_env_key(self.env))
+        except subprocess.CalledProcessError as e:
+            # Only git init -b is known to fail on old git versions; anything
+            # else is reported as is, with git's output on stderr
+            if e.cmd[1:2] == ["init"]:
+                self.fail(
+                    "git version is too old for tests! Please install a newer version of git."
+                )
+            raise
+        shutil.copytree(template_dir, self.temp_dir.name, dirs_exist_ok=True)
 
     def normalize_path(self, text: Any) -> Union[str, List[object], Any]:
         """Normalize temporary directory paths in output text."""
         if self.temp_dir and self.temp_dir.name:
+            # Plain strings are by far the most common case, so check the exact
+            # type before probing for attributes
+            if type(text) is str:
+                return text.replace(self.temp_dir.name, "/tmp/test_dir")
+
             # Handle CallToolResult objects by converting to string first
             if hasattr(text, "content"):
                 # This is a CallToolResult object, extract the content
@@ -197,7 +282,7 @@ class MCPEndToEndTestCase(TestCase, unittest.IsolatedAsyncioTestCase):
         Raises:
             AssertionError: If chat_id cannot be found in text
         """
-        chat_id_match = re.search(r"chat ID: ([a-zA-Z0-9-]+)", text)
+        chat_id_match = _CHAT_ID_RE.search(text)
         assert chat_id_match is not None, "Could not find chat ID in text"
         return chat_id_match.group(1)
 
@@ -325,7 +410,7 @@ class MCPEndToEndTestCase(TestCase, unittest.IsolatedAsyncioTestCase):
         )
 
         # Extract chat_id from the init result
-        chat_id_match = re.search(r"chat ID: ([a-zA-Z0-9-]+)", str(init_result_text))
+        chat_id_match = _CHAT_ID_RE.search(str(init_result_text))
         assert chat_id_match is not None, (
             "Could not find chat ID in initialization result"
         )
@@ -333,28 +418,22 @@ class MCPEndToEndTestCase(TestCase, unittest.IsolatedAsyncioTestCase):
 
         return chat_id
 
+    @staticmethod
     @asynccontextmanager
-    async def _unwrap_exception_groups(self) -> AsyncGenerator[None, None]:
+    async def _unwrap_exception_groups() -> AsyncGenerator[None, None]:
         """Context manager that unwraps ExceptionGroups with single exceptions.
         Only unwraps if there's exactly one exception at each level.
         """
         try:
             yield
-        except ExceptionGroup as eg:
-            # Since we're using our own ExceptionGroup implementation,
-            # we know exceptions is a List[Exception]
-            if len(eg.exceptions) == 1:
-                exc: Exception = eg.exceptions[0]
-                # Recursively unwrap if it's another ExceptionGroup with a single exception
-                while isinstance(exc, ExceptionGroup):
-                    if len(exc.exceptions) == 1:
-                        exc = exc.exceptions[0]
-                    else:
-                        break
-                raise exc from None
-            else:
+        except* Exception as eg:
+            exc: BaseException = eg
+            while isinstance(exc, BaseExceptionGroup) and len(exc.exceptions) == 1:
+                exc = exc.exceptions[0]
+            if exc is eg:
                 # Multiple exceptions - don't unwrap
                 raise
+            raise exc from exc.__cause__
 
     @asynccontextmanager
     async def create_client_session(
@@ -375,11 +454,10 @@ class MCPEndToEndTestCase(TestCase, unittest.IsolatedAsyncioTestCase):
 
         async with self._unwrap_exception_groups():
             async with stdio_client(server_params) as (read, write):
-                async with self._unwrap_exception_groups():
-                    async with ClientSession(read, write) as session:
-                        # Initialize the connection
-                        await session.initialize()
-                        yield session
+                async with ClientSession(read, write) as session:
+                    # Initialize the connection
+                    await session.initialize()
+                    yield session
 
     async def git_run(
         self,
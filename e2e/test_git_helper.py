@@ -6,12 +6,26 @@ import os
 import subprocess
 import unittest
 
-from codemcp.testing import MCPEndToEndTestCase
+from codemcp.testing import (
+    MCPEndToEndTestCase,
+    _template_env_key,
+    _template_repository,
+)
 
 
 class GitHelperTest(MCPEndToEndTestCase):
     """Test the git_run helper method."""
 
+    async def test_setup_reuses_template_repository(self):
+        """Test that repository setup reuses one template across tests."""
+        # Variables unrelated to git, like the per-test PYTEST_CURRENT_TEST,
+        # must not produce a new template
+        env_a = dict(self.env, PYTEST_CURRENT_TEST="test_a (call)")
+        env_b = dict(self.env, PYTEST_CURRENT_TEST="test_b (call)")
+        template_dir = _template_repository(_template_env_key(self.env))
+        self.assertEqual(_template_repository(_template_env_key(env_a)), template_dir)
+        self.assertEqual(_template_repository(_template_env_key(env_b)), template_dir)
+
     async def test_git_add_and_commit(self):
         """Test basic git add and commit operations using the helper."""
         # Create a test file
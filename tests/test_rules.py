@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from codemcp.rules import load_rule_from_file, match_file_with_glob
+from codemcp.rules import (
+    _FRONTMATTER_CHUNK_SIZE,
+    Rule,
+    find_applicable_rules,
+    get_applicable_rules_content,
+    load_rule_from_file,
+    match_file_with_glob,
+)
 
 
 class TestRules(unittest.TestCase):
@@ -63,6 +72,125 @@ This is a glob test rule
         self.assertIsNotNone(rule)
         self.assertEqual(rule.globs, ["*.js", "*.ts", "src/**/*.jsx"])
 
+    def test_load_rule_from_file_reloads_after_edit(self):
+        test_mdc_path = self.test_dir / "edited_rule.mdc"
+        with open(test_mdc_path, "w") as f:
+            f.write("---\ndescription: Before\n---\nOld payload\n")
+
+        rule = load_rule_from_file(str(test_mdc_path))
+        self.assertIsNotNone(rule)
+        self.assertEqual(rule.description, "Before")
+
+        # Editing the file (different size) must invalidate the cached rule
+        with open(test_mdc_path, "w") as f:
+            f.write("---\ndescription: After edit\n---\nNew payload\n")
+
+        rule = load_rule_from_file(str(test_mdc_path))
+        self.assertIsNotNone(rule)
+        self.assertEqual(rule.description, "After edit")
+        self.assertEqual(rule.payload, "New payload")
+
+    def test_load_rule_from_file_delimiter_across_chunk_boundary(self):
+        # Place the closing "\n---\n" at every offset where it straddles the
+        # end of the first chunk that is read
+        prefix = "---\ndescription: "
+        for delimiter_start in range(
+            _FRONTMATTER_CHUNK_SIZE - 5, _FRONTMATTER_CHUNK_SIZE + 1
+        ):
+            description = "x" * (delimiter_start - len(prefix))
+            test_mdc_path = self.test_dir / f"boundary_{delimiter_start}.mdc"
+            with open(test_mdc_path, "w") as f:
+                f.write(f"{prefix}{description}\n---\nBoundary payload\n")
+
+            rule = load_rule_from_file(str(test_mdc_path))
+            self.assertIsNotNone(rule, delimiter_start)
+            self.assertEqual(rule.description, description)
+            self.assertEqual(rule.payload, "Boundary payload")
+
+    def test_load_rule_from_file_unterminated_frontmatter_larger_than_chunk(self):
+        test_mdc_path = self.test_dir / "unterminated_rule.mdc"
+        with open(test_mdc_path, "w") as f:
+            f.write("---\ndescription: Never closed\n")
+            f.write("x" * (3 * _FRONTMATTER_CHUNK_SIZE))
+
+        self.assertIsNone(load_rule_from_file(str(test_mdc_path)))
+
+    def test_rule_payload_not_taken_from_edited_file(self):
+        test_mdc_path = self.test_dir / "stale_rule.mdc"
+        with open(test_mdc_path, "w") as f:
+            f.write("---\ndescription: A\n---\nold body\n")
+        rule = load_rule_from_file(str(test_mdc_path))
+        self.assertIsNotNone(rule)
+
+        # Edit the file before the payload has been read
+        with open(test_mdc_path, "w") as f:
+            f.write("---\ndescription: B\n---\nnew body, longer\n")
+
+        # The old rule must not pick up (and cache) the new body
+        self.assertEqual(rule.description, "A")
+        self.assertEqual(rule.payload, "")
+
+        rule = load_rule_from_file(str(test_mdc_path))
+        self.assertIsNotNone(rule)
+        self.assertEqual(rule.description, "B")
+        self.assertEqual(rule.payload, "new body, longer")
+
+    def test_rules_content_skips_rule_whose_file_vanished(self):
+        rules_dir = self.test_dir / ".cursor" / "rules"
+        os.makedirs(rules_dir)
+        with open(rules_dir / "kept.mdc", "w") as f:
+            f.write("---\nalwaysApply: true\n---\nKept payload\n")
+        gone_path = rules_dir / "gone.mdc"
+        with open(gone_path, "w") as f:
+            f.write("---\nalwaysApply: true\n---\nGone payload\n")
+
+        def find_then_delete(repo_root: str, file_path: str | None = None):
+            result = find_applicable_rules(repo_root, file_path)
+            os.remove(gone_path)
+            return result
+
+        # The rule was found, but its file is gone by the time the payload is
+        # read: it is left out rather than shown with an empty body
+        with mock.patch(
+            "codemcp.rules.find_applicable_rules", side_effect=find_then_delete
+        ):
+            content = get_applicable_rules_content(str(self.test_dir))
+
+        self.assertIn("// Rule from .cursor/rules/kept.mdc:\nKept payload", content)
+        self.assertNotIn("gone.mdc", content)
+
+    def test_rule_fields_after_always_apply_are_keyword_only(self):
+        # file_path used to follow the payload; an old positional call must fail
+        with self.assertRaises(TypeError):
+            Rule("desc", ["*.py"], True, "payload", "rule.mdc")  # type: ignore
+
+    def test_suggested_rule_payload_is_never_read(self):
+        rules_dir = self.test_dir / ".cursor" / "rules"
+        os.makedirs(rules_dir)
+        suggested_path = rules_dir / "suggested.mdc"
+        with open(suggested_path, "w") as f:
+            f.write("---\ndescription: Suggested rule\n---\nSuggested payload\n")
+
+        real_open = open
+        opened: list[str] = []
+
+        def recording_open(file: str, *args: object, **kwargs: object):
+            opened.append(str(file))
+            return real_open(file, *args, **kwargs)
+
+        with mock.patch("codemcp.rules.open", side_effect=recording_open, create=True):
+            content = get_applicable_rules_content(str(self.test_dir))
+
+        self.assertIn("// If Suggested rule applies, load", content)
+        self.assertNotIn("Suggested payload", content)
+        # Opened once, to parse the frontmatter, and never for the payload
+        self.assertEqual(opened, [str(suggested_path)])
+        # load_rule_from_file returns the same cached Rule, whose payload has
+        # not been loaded
+        rule = load_rule_from_file(str(suggested_path))
+        self.assertIsNotNone(rule)
+        self.assertIsNone(rule._payload)
+
     def test_load_rule_from_file_invalid(self):
         # Create an invalid MDC file (missing frontmatter)
         test_mdc_path = self.test_dir / "invalid_rule.mdc"
@@ -91,6 +219,31 @@ This is a glob test rule
         self.assertFalse(match_file_with_glob("path/to/test.ts", "*.js"))
         self.assertFalse(match_file_with_glob("lib/test.jsx", "src/**/*.jsx"))
 
+    def test_match_file_with_glob_extension_patterns(self):
+        # *.ext and dir/**/*.ext are matched without a regex; make sure they
+        # agree with the general glob semantics
+        self.assertTrue(match_file_with_glob("a/b/test.py", "*.py"))
+        self.assertTrue(match_file_with_glob("test.py", "**/*.py"))
+        self.assertTrue(match_file_with_glob("src/test.py", "src/**/*.py"))
+        self.assertFalse(match_file_with_glob("test.pyi", "**/*.py"))
+        self.assertFalse(match_file_with_glob("srcx/test.py", "src/**/*.py"))
+        # A *. pattern with a path separator is not a file name suffix
+        self.assertTrue(match_file_with_glob("x.d/conf", "*.d/conf"))
+
+        # Exact names, dir/*.ext and *name* patterns
+        self.assertTrue(match_file_with_glob("a/config.json", "config.json"))
+        self.assertTrue(match_file_with_glob("a/config.json", "a/config.json"))
+        self.assertFalse(match_file_with_glob("b/a/config.json", "a/config.json"))
+        self.assertTrue(match_file_with_glob("src/main.py", "src/*.py"))
+        self.assertFalse(match_file_with_glob("src/sub/main.py", "src/*.py"))
+        self.assertFalse(match_file_with_glob("lib/src/main.py", "src/*.py"))
+        self.assertTrue(match_file_with_glob("a/foo_test_bar.py", "*test*"))
+        self.assertFalse(match_file_with_glob("test/foo.py", "*test*"))
+
+        # Patterns with other special characters fall back to the regex matcher
+        self.assertTrue(match_file_with_glob("lib/main.c", "*.[ch]"))
+        self.assertFalse(match_file_with_glob("lib/main.o", "*.[ch]"))
+
     def test_match_file_with_trailing_double_star(self):
         # Test glob patterns ending with /**
         # Create normalized relative paths for testing
@@ -109,6 +262,51 @@ This is a glob test rule
         self.assertFalse(match_file_with_glob(xyz_file, "abc/**"))
         self.assertFalse(match_file_with_glob(abc_other_file, "abc/**"))
 
+    def test_find_applicable_rules_skips_unreadable_rules_subdirectory(self):
+        rules_dir = self.test_dir / ".cursor" / "rules"
+        os.makedirs(rules_dir / "private")
+        with open(rules_dir / "top.mdc", "w") as f:
+            f.write("---\nalwaysApply: true\n---\nTop rule\n")
+        with open(rules_dir / "private" / "hidden.mdc", "w") as f:
+            f.write("---\nalwaysApply: true\n---\nHidden rule\n")
+
+        real_scandir = os.scandir
+
+        def failing_scandir(path: str):
+            if os.path.basename(path) == "private":
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        # An unreadable subdirectory is skipped, like os.walk does, instead of
+        # dropping the rules that could be read
+        with mock.patch("codemcp.rules.os.scandir", side_effect=failing_scandir):
+            applicable_rules, _ = find_applicable_rules(str(self.test_dir))
+        self.assertEqual([rule.payload for rule in applicable_rules], ["Top rule"])
+
+        # The incomplete listing is not cached
+        applicable_rules, _ = find_applicable_rules(str(self.test_dir))
+        self.assertEqual(
+            sorted(rule.payload for rule in applicable_rules),
+            ["Hidden rule", "Top rule"],
+        )
+
+    def test_find_applicable_rules_ignores_sibling_with_common_prefix(self):
+        # /repo-other starts with the string /repo but is not inside it
+        repo_root = self.test_dir / "repo"
+        other_dir = self.test_dir / "repo-other"
+        os.makedirs(repo_root)
+        os.makedirs(other_dir / ".cursor" / "rules")
+        with open(other_dir / ".cursor" / "rules" / "other.mdc", "w") as f:
+            f.write("---\nalwaysApply: true\n---\nOther repo rule\n")
+        other_file = other_dir / "file.py"
+        other_file.write_text("")
+
+        applicable_rules, suggested_rules = find_applicable_rules(
+            str(repo_root), str(other_file)
+        )
+        self.assertEqual(applicable_rules, [])
+        self.assertEqual(suggested_rules, [])
+
 
 if __name__ == "__main__":
     unittest.main()